@@ -1,16 +1,22 @@
+from __future__ import annotations
 import os
 import sys
-from io import BufferedReader, BytesIO, SEEK_SET
+import shutil
+import asyncio
+import threading
+from io import BufferedReader, SEEK_SET
 from argparse import ArgumentParser, Namespace
-from typing import Tuple
+from typing import Tuple, TYPE_CHECKING
 from time import perf_counter
-from dataclasses import dataclass
+from functools import cache
+from dataclasses import dataclass, field
 import json
-from googletrans import LANGUAGES, Translator # type: ignore
-from googletrans.models import Translated # type: ignore
-import progressbar as bar # type: ignore
+import re
+import struct
 
-LANG_CODES: list[str] = [key for key in LANGUAGES.keys()]
+if TYPE_CHECKING:
+	from googletrans import Translator # type: ignore
+	from googletrans.models import Translated # type: ignore
 
 DEFAULT_FIRST_THAILAND_BYTE = 99012
 '''Decimal byte position in translation file'''
@@ -18,56 +24,121 @@ DEFAULT_FIRST_THAILAND_BYTE = 99012
 DEFAULT_LAST_THAILAND_BYTE = 13822703
 '''Decimal byte position in translation file'''
 
-DEFAULT_TRANSLATION_BATCH_SIZE = 5
+DEFAULT_TRANSLATION_BATCH_SIZE = 100
+
+TRANSLATION_REQUEST_MAX_SIZE = 4500
+'''Maximum UTF-8 byte size of packed strings sent in single translation request'''
+
+TRANSLATION_SEPARATOR = '\n@@@\n'
+'''Sentinel joining packed strings, preserved by Google Translate'''
+
+TRANSLATION_SEPARATOR_PATTERN = re.compile(r'\s*@@@\s*')
+
+DEFAULT_TRANSLATION_POOL_SIZE = 8
+'''Maximum number of translation requests in flight'''
+
+UNIT_HEADER = struct.Struct('<II')
+'''Binary unit header: little endian id and text length'''
+
+TRANSLATION_RETRY_DELAY = 1.0
+'''Seconds to wait before retrying failed translation request'''
+
+TRANSLATION_STOP = threading.Event()
+'''Set when translation gets interrupted, stops retrying worker threads'''
+
+COMPARE_BUFFER_SIZE = 1024 * 1024
+
+TRANSLATION_CACHE: dict[Tuple[str, str, str], str] = {}
+'''Translated texts keyed by source language, target language and origin text'''
 
 def eprint(*args, **kwargs): # type: ignore
     print(*args, file=sys.stderr, **kwargs) # type: ignore
 
+def is_patchable_copy(original_path: str, copy_path: str, start: int, stop: int) -> bool:
+	'''Checks if copy_path equals original_path outside of bytes from start to stop, which get overwritten'''
+	if not os.path.exists(copy_path):
+		return False
+
+	if os.path.samefile(original_path, copy_path):
+		return True
+
+	if os.path.getsize(original_path) != os.path.getsize(copy_path):
+		return False
+
+	def equal_until(original: BufferedReader, copy: BufferedReader, end: int | None) -> bool:
+		while end is None or original.tell() < end:
+			length = COMPARE_BUFFER_SIZE if end is None else min(COMPARE_BUFFER_SIZE, end - original.tell())
+			original_chunk = original.read(length)
+			if original_chunk != copy.read(length):
+				return False
+			if not original_chunk:
+				return True
+		return True
+
+	with open(original_path, 'rb') as original, open(copy_path, 'rb') as copy:
+		if not equal_until(original, copy, start):
+			return False
+
+		original.seek(stop, SEEK_SET)
+		copy.seek(stop, SEEK_SET)
+		return equal_until(original, copy, None)
+
+@cache
+def get_translator() -> Translator:
+	'''Returns shared translator reusing its HTTP connections across batches'''
+	from googletrans import Translator # type: ignore
+	return Translator()
+
+@cache
+def get_lang_codes() -> list[str]:
+	'''Imports googletrans on first use, so runs without translation start faster'''
+	from googletrans import LANGUAGES # type: ignore
+	return [key for key in LANGUAGES.keys()]
+
+def __getattr__(name: str) -> object:
+	if name == 'LANG_CODES':
+		return get_lang_codes()
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+EXPRESSION_DELIMITERS: dict[str, str] = {'[': ']', '{': '}', '<': '>'}
+'''Special expression open delimiters mapped to their close delimiters'''
+
+EXPRESSION_OPEN_PATTERN = re.compile(r'[\[{<]')
+
 class SpecialExpressions:
 	@staticmethod
-	def has_special_char(value: str, chars: list[str] = ['[', '{', '<']) -> bool:
+	def has_special_char(value: str) -> bool:
 		'''Checks if str contains one of special characters'''
-		for c in chars:
-			if c in value:
-				return True
-			
-		return False
+		return '[' in value or '{' in value or '<' in value
 	
 	@staticmethod
-	def split_str(value: str, 
-				  expressions_delimiters: list[Tuple[str, str]] = 
-				  	[('[', ']'), ('{', '}'), ('<', '>')]
-				  ) -> list[str]:
-		if not SpecialExpressions.has_special_char(value):
-			return [value]
-		
+	def split_str(value: str) -> list[str]:
+		'''Splits str into plain text and special expression parts in single left to right scan'''
 		result: list[str] = []
+		literal_start = 0
 
-		while True:
-			if not SpecialExpressions.has_special_char(value):
-				return result + [value]
-
-			open_delimiter_positions: dict[int, Tuple[str, str]] = {}
-			for pair in expressions_delimiters:
-				if pair[0] in value:
-					open_delimiter_positions[value.find(pair[0])] = pair
-
-			open_position: int = len(value)
-			for position in open_delimiter_positions:
-				open_position = min(open_position, position)
-
-			delimiters = open_delimiter_positions[open_position]
-			if open_position > 0:
-				result.append(value[0:open_position])
-
-			close_position: int = value.find(delimiters[1])
+		open_match = EXPRESSION_OPEN_PATTERN.search(value)
+		while open_match is not None:
+			open_position: int = open_match.start()
+			if open_position > literal_start:
+				result.append(value[literal_start:open_position])
 
+			close_position: int = value.find(EXPRESSION_DELIMITERS[open_match.group()], open_position + 1)
 			if close_position == -1:
 				return result
-			
+
 			result.append(value[open_position:close_position + 1])
+			literal_start = close_position + 1
+			open_match = EXPRESSION_OPEN_PATTERN.search(value, literal_start)
 
-			value = value[close_position + 1:]
+		result.append(value[literal_start:])
+		return result
+
+class LanguageCodesArgumentParser(ArgumentParser):
+	'''Lists possible language codes in epilog only when help gets printed'''
+	def format_help(self) -> str:
+		self.epilog = f'Possible language codes: {" ".join(get_lang_codes())}'
+		return super().format_help()
 
 class Args(Namespace):
 	'''Parses and holds command line arguments'''
@@ -86,14 +157,15 @@ class Args(Namespace):
 	replace_first_byte: int
 	replace_last_byte: int
 	batch_size: int
+	pool_size: int
 	
 	@staticmethod
 	def parse() -> 'Args':
-		argparser = ArgumentParser(prog='sandrock-translator', epilog=f'Possible language codes: {" ".join(LANG_CODES)}')
+		argparser = LanguageCodesArgumentParser(prog='sandrock-translator')
 		argparser.add_argument('input_file', type=str, help='Path to original translation file')
 		argparser.add_argument('output_file', type=str, help='Path to target translation file')
-		argparser.add_argument('-s', '--source_lang_code', type=str, default='auto', choices=['auto', *LANG_CODES], metavar="SOURCE_LANG_CODE", help='Force translation source language code. auto will detect language. default: auto')
-		argparser.add_argument('-t', '--target_lang_code', type=str, default='', choices=LANG_CODES, metavar="TARGET_LANG_CODE", help='Target language code. If not specified translation step will be skipped.')
+		argparser.add_argument('-s', '--source_lang_code', type=str, default='auto', metavar="SOURCE_LANG_CODE", help='Force translation source language code. auto will detect language. default: auto')
+		argparser.add_argument('-t', '--target_lang_code', type=str, default='', metavar="TARGET_LANG_CODE", help='Target language code. If not specified translation step will be skipped.')
 		argparser.add_argument('-o', '--output_file_type', type=str, default='binary', choices=['binary', 'json'], help='default: binary')
 		argparser.add_argument('-v', '--verbose', action='store_true', help='Print additional information at execution.')
 
@@ -110,10 +182,16 @@ class Args(Namespace):
 		group_replacement.add_argument('-p', '--pedantic', action='store_true', help='Abort execution when any replacement string does not fit into translation.')
 		
 		group_utils = argparser.add_argument_group('Utils')
-		group_utils.add_argument('-b', '--batch_size', type=int, default=DEFAULT_TRANSLATION_BATCH_SIZE, help=f'Number of strings per translation request. default: {DEFAULT_TRANSLATION_BATCH_SIZE}')
+		group_utils.add_argument('-b', '--batch_size', type=int, default=DEFAULT_TRANSLATION_BATCH_SIZE, help=f'Number of units per translation batch. default: {DEFAULT_TRANSLATION_BATCH_SIZE}')
+		group_utils.add_argument('-j', '--pool_size', type=int, default=DEFAULT_TRANSLATION_POOL_SIZE, help=f'Maximum number of concurrent translation requests. default: {DEFAULT_TRANSLATION_POOL_SIZE}')
 
 		parsed = argparser.parse_args(namespace=Args())
 
+		if parsed.source_lang_code != 'auto' and parsed.source_lang_code not in get_lang_codes():
+			argparser.error(f"argument -s/--source_lang_code: invalid choice: '{parsed.source_lang_code}' (see --help for possible language codes)")
+		if parsed.target_lang_code != '' and parsed.target_lang_code not in get_lang_codes():
+			argparser.error(f"argument -t/--target_lang_code: invalid choice: '{parsed.target_lang_code}' (see --help for possible language codes)")
+
 		if not os.path.exists(parsed.input_file):
 			print('Input file does not exist!')
 			argparser.print_usage()
@@ -139,6 +217,8 @@ class ProgressTracker:
 		self._total = total or 1
 		self._last_timestamp: float = perf_counter()
 		self._last_current = 0
+
+		import progressbar as bar # type: ignore
 		self._progress_bar = bar.ProgressBar(fd=sys.stdout, maxval=total, widgets=[
 			'Progress: ',
 			bar.Percentage(), ' ',
@@ -179,6 +259,12 @@ class TranslationUnit:
 	id: int
 	size: ByteSize
 	text: str
+	max_size: ByteSize = field(init=False, repr=False, compare=False)
+	_encoded: bytes | None = field(default=None, init=False, repr=False, compare=False)
+	_encoded_text: str | None = field(default=None, init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		self.max_size = (self.size + 3) & ~3
 
 	def replace(self, replacer: 'TranslationUnit', allow_overflow: bool) -> bool:
 		'''
@@ -186,36 +272,69 @@ class TranslationUnit:
 			Returns true when replacement string fits.
 		'''
 		replacer_text_bytes: bytes = replacer.text.encode(encoding='utf-8')
-		if len(replacer_text_bytes) > self.max_size:
-			if not allow_overflow:
-				return False
-			
-			if SpecialExpressions.has_special_char(self.text) or SpecialExpressions.has_special_char(replacer.text):
-				return False
+		if len(replacer_text_bytes) <= self.max_size:
+			self.assign_text(replacer.text, replacer_text_bytes)
+			return True
+
+		if not allow_overflow:
+			return False
+		
+		if SpecialExpressions.has_special_char(self.text) or SpecialExpressions.has_special_char(replacer.text):
+			return False
 
 		self.text = (replacer_text_bytes[:self.max_size]).decode(encoding='utf-8', errors='ignore')
 		return True
 
+	def assign_text(self, text: str, encoded: bytes) -> None:
+		'''Sets text together with its already known UTF-8 encoding'''
+		self.text = text
+		self._cache_encoded(encoded)
+
+	def _cache_encoded(self, encoded: bytes) -> None:
+		self._encoded = encoded[:self.max_size]
+		self._encoded_text = self.text
+
 	def to_dict(self) -> dict: # type: ignore
 		return {'id': self.id, 'size': self.max_size, 'text': self.text} # type: ignore
 
 	@property
-	def bytes(self) -> bytes:
-		return bytes().join(
-			[
-				self.id.to_bytes(4, byteorder='little'),
-				self.max_size.to_bytes(4, byteorder='little'),
-				self.text.encode(encoding='utf-8')[:self.max_size],
-				b'\x00' * (self.max_size - len(self.text.encode(encoding='utf-8')))
-			]
-		)
+	def encoded(self) -> bytes:
+		'''UTF-8 encoded text truncated to max_size, cached until text changes'''
+		if self._encoded is None or self._encoded_text is not self.text:
+			self._encoded = self.text.encode(encoding='utf-8')[:self.max_size]
+			self._encoded_text = self.text
+		return self._encoded
+
+	def pack_into(self, buffer: bytearray, offset: int) -> int:
+		'''Writes unit into zero initialized buffer at offset. Returns offset past written unit.'''
+		encoded = self.encoded
+		UNIT_HEADER.pack_into(buffer, offset, self.id, self.max_size)
+		text_offset = offset + 8
+		buffer[text_offset:text_offset + len(encoded)] = encoded
+		return text_offset + self.max_size
 
 	@property
-	def max_size(self) -> ByteSize:
-		if self.size % 4 == 0:
-			return self.size
+	def bytes(self) -> bytes:
+		buffer = bytearray(8 + self.max_size)
+		self.pack_into(buffer, 0)
+		return bytes(buffer)
 
-		return self.size + (4 - self.size % 4)
+	@staticmethod
+	def to_bytearray(units: list['TranslationUnit']) -> bytearray:
+		'''Serializes units into single preallocated buffer'''
+		buffer = bytearray(sum(u.max_size + 8 for u in units))
+		offset = 0
+		for u in units:
+			offset = u.pack_into(buffer, offset)
+
+		return buffer
+
+	@staticmethod
+	def from_encoded(id: int, size: ByteSize, text: str, encoded: bytes) -> 'TranslationUnit':
+		'''Creates unit reusing already known UTF-8 encoding of text'''
+		unit = TranslationUnit(id, size, text)
+		unit._cache_encoded(encoded)
+		return unit
 
 	@staticmethod
 	def from_dict(value: dict) -> 'TranslationUnit': # type: ignore
@@ -236,7 +355,8 @@ class TranslationUnit:
 	def translate(original_units: list['TranslationUnit'], 
 				  original_language: str, 
 				  target_language: str,
-				  verbose: bool) -> TranslationResult:
+				  verbose: bool,
+				  translator: Translator | None = None) -> TranslationResult:
 		'''Returns tuple of translated units and omitted strings'''
 		def into_translation_payload(strings_parted: list[list[str]]) -> list[str]:
 			def contains_at_least_alnum(string: str, occurrences: int) -> bool:
@@ -248,48 +368,81 @@ class TranslationUnit:
 					if counter == occurrences:
 						return True
 				return False
-			
-			payload: list[str] = []
-			for unit_strings in strings_parted:
-				for string in unit_strings:
-					if SpecialExpressions.has_special_char(string):
-						continue
 
-					# Google Translate doesn't like translating single special
-					# characters, whitespace and empty strings
-					if not contains_at_least_alnum(string, 2):
-						continue
+			has_special_char = SpecialExpressions.has_special_char
 
-					if string.isspace():
-						continue
-
-					payload.append(string)
-
-			return payload
+			# Google Translate doesn't like translating single special
+			# characters, whitespace and empty strings
+			return [string
+					for unit_strings in strings_parted
+					for string in unit_strings
+					if not has_special_char(string) and contains_at_least_alnum(string, 2)]
 		
-		translator = Translator()
+		def into_request_chunks(payload: list[str]) -> list[list[str]]:
+			chunks: list[list[str]] = []
+			chunk: list[str] = []
+			chunk_size = 0
+			for string in payload:
+				string_size = len(string.encode(encoding='utf-8')) + len(TRANSLATION_SEPARATOR)
+				if chunk and chunk_size + string_size > TRANSLATION_REQUEST_MAX_SIZE:
+					chunks.append(chunk)
+					chunk = []
+					chunk_size = 0
+				chunk.append(string)
+				chunk_size += string_size
+
+			if chunk:
+				chunks.append(chunk)
+			return chunks
+
+		def request(payload: str | list[str]) -> Translated | list[Translated]:
+			while not TRANSLATION_STOP.is_set():
+				try:
+					return translator.translate(payload, # type: ignore
+												src=original_language, 
+												dest=target_language)
+				except KeyboardInterrupt as e:
+					raise e
+				except:
+					print('\nGoogle Trans API Network Error, retrying connection...')
+					TRANSLATION_STOP.wait(TRANSLATION_RETRY_DELAY)
+
+			raise KeyboardInterrupt()
+
+		def translate_chunk(chunk: list[str]) -> list[Tuple[str, str]]:
+			'''Returns pairs of origin and translated text'''
+			packed: Translated = request(TRANSLATION_SEPARATOR.join(chunk)) # type: ignore
+			texts: list[str] = TRANSLATION_SEPARATOR_PATTERN.split(packed.text.strip()) # type: ignore
+			if len(texts) == len(chunk):
+				return list(zip(chunk, texts))
+
+			# Separator got mangled, fall back to translating strings one by one
+			unpacked: list[Translated] = request(chunk) # type: ignore
+			return [(t.origin, t.text) for t in unpacked] # type: ignore
+
+		translator = translator or get_translator()
 		original_strings: list[str] = [unit.text for unit in original_units]
 		strings_parted: list[list[str]] = \
 			[SpecialExpressions.split_str(string) for string in original_strings]
 		translation_payload: list[str] = into_translation_payload(strings_parted)
 
-		translated: list[Translated] = []
-		while True:
-			try:
-				translated = translator.translate(translation_payload, # type: ignore
-												  src=original_language, 
-												  dest=target_language)
-				break
-			except KeyboardInterrupt as e:
-				raise e
-			except:
-				print('\nGoogle Trans API Network Error, retrying connection...')
+		translation_map: dict[str, str] = {}
+		untranslated: list[str] = []
+		for string in dict.fromkeys(translation_payload):
+			cached: str | None = TRANSLATION_CACHE.get((original_language, target_language, string))
+			if cached is None:
+				untranslated.append(string)
+			else:
+				translation_map[string] = cached
+
+		for chunk in into_request_chunks(untranslated):
+			for origin, text in translate_chunk(chunk):
+				translation_map.setdefault(origin, text)
+				TRANSLATION_CACHE.setdefault((original_language, target_language, origin), text)
 
 		for i in range(len(strings_parted)):
 			for j in range(len(strings_parted[i])):
-				for t in translated:
-					if strings_parted[i][j] == t.origin:
-						strings_parted[i][j] = t.text
+				strings_parted[i][j] = translation_map.get(strings_parted[i][j], strings_parted[i][j])
 		
 		translated_strings: list[str] = \
 			[' '.join(unit_strings) for unit_strings in strings_parted]
@@ -298,11 +451,15 @@ class TranslationUnit:
 		omitted_strings = 0
 		for i in range(len(original_units)):
 			candidate: str = translated_strings[i]
+			candidate_bytes: bytes = candidate.encode(encoding='utf-8')
 			max_length: int = original_units[i].max_size
 
-			if len(candidate.encode(encoding='utf-8')) > max_length \
-				   and SpecialExpressions.has_special_char(candidate):
-				
+			if len(candidate_bytes) <= max_length:
+				result.append(TranslationUnit.from_encoded(original_units[i].id, 
+														   max_length, 
+														   candidate, 
+														   candidate_bytes))
+			elif SpecialExpressions.has_special_char(candidate):
 				result.append(original_units[i])
 				omitted_strings += 1
 
@@ -316,25 +473,63 @@ class TranslationUnit:
 		return TranslationResult(result, omitted_strings)
 
 	@staticmethod
-	def translate_by_batch(original_units: list['TranslationUnit'], 
-						   batch_size: int, 
-						   origin_lang_code: str, 
-						   target_lang_code: str,
-						   verbose: bool) -> 'TranslationResult':
-		translated_units: list[TranslationUnit] = []
+	async def translate_async(original_units: list['TranslationUnit'], 
+							  original_language: str, 
+							  target_language: str,
+							  verbose: bool,
+							  translator: Translator | None = None) -> TranslationResult:
+		'''Runs blocking translate in worker thread'''
+		return await asyncio.to_thread(TranslationUnit.translate,
+									   original_units,
+									   original_language,
+									   target_language,
+									   verbose,
+									   translator)
+
+	@staticmethod
+	async def translate_by_batch(original_units: list['TranslationUnit'], 
+								 batch_size: int, 
+								 origin_lang_code: str, 
+								 target_lang_code: str,
+								 verbose: bool,
+								 pool_size: int = DEFAULT_TRANSLATION_POOL_SIZE) -> 'TranslationResult':
 		progress_tracker = ProgressTracker(len(original_units))
-		omitted_strings = 0
-		for i in range(0, len(original_units), batch_size):
-			progress_tracker.next(i)
+		semaphore = asyncio.Semaphore(max(pool_size, 1))
+		translator = get_translator()
+		batch_starts = range(0, len(original_units), batch_size)
+		translated_batches: list[TranslationResult | None] = [None] * len(batch_starts)
+		translated_count = 0
+
+		async def bounded(i: int) -> None:
+			nonlocal translated_count
 			next_batch = original_units[i:i + batch_size]
-			translated_batch = \
-				TranslationUnit.translate(next_batch,
-											origin_lang_code,
-											target_lang_code,
-											verbose)
+			async with semaphore:
+				translated_batch = \
+					await TranslationUnit.translate_async(next_batch,
+														  origin_lang_code,
+														  target_lang_code,
+														  verbose,
+														  translator)
+			translated_batches[i // batch_size] = translated_batch
+			translated_count += len(next_batch)
+			progress_tracker.next(translated_count)
+
+		TRANSLATION_STOP.clear()
+		try:
+			await asyncio.gather(*[bounded(i) for i in batch_starts])
+		except (asyncio.CancelledError, KeyboardInterrupt):
+			# Worker threads can't be interrupted, let them leave retry loop
+			# so asyncio.run doesn't wait for them forever
+			TRANSLATION_STOP.set()
+			raise
+		progress_tracker.finish()
+
+		translated_units: list[TranslationUnit] = []
+		omitted_strings = 0
+		for translated_batch in translated_batches:
+			assert translated_batch is not None
 			translated_units += translated_batch.units
 			omitted_strings += translated_batch.omitted
-		progress_tracker.finish()
 		return TranslationResult(translated_units, omitted_strings)
 
 	@staticmethod
@@ -345,29 +540,34 @@ class TranslationUnit:
 		pedantic: bool,
 		allow_overflow: bool) -> None:
 		'''Replace original translation texts with replacer translation texts'''
-		replace_map: dict[int, 'TranslationUnit'] = {}
-		for u in replace_units:
-			replace_map[u.id] = u
+		replace_map: dict[int, 'TranslationUnit'] = {u.id: u for u in replace_units}
 
 		replaced_counter = 0
+		missing_ids: list[int] = []
 		for u in original_units:
-			if u.id in replace_map:
-				if u.replace(replace_map[u.id], allow_overflow):
-					replaced_counter += 1
-				else:
-					if verbose:
-						eprint(f'Too long replace string with id: {u.id}')
-					if pedantic:
-						eprint('Aborted because of pedantic flag')
-						exit(1)
+			replacer = replace_map.get(u.id)
+			if replacer is None:
+				missing_ids.append(u.id)
+				continue
+
+			if u.replace(replacer, allow_overflow):
+				replaced_counter += 1
 			else:
 				if verbose:
-					eprint(f'Missing replace string for original id: {u.id}')
-
+					eprint(f'Too long replace string with id: {u.id}')
 				if pedantic:
-					eprint('Selected replace localization sector does not contain original localization unit ID!')
 					eprint('Aborted because of pedantic flag')
 					exit(1)
+
+		if missing_ids:
+			if verbose:
+				for id in missing_ids:
+					eprint(f'Missing replace string for original id: {id}')
+
+			if pedantic:
+				eprint(f'Selected replace localization sector does not contain {len(missing_ids)} original localization unit IDs!')
+				eprint('Aborted because of pedantic flag')
+				exit(1)
 			
 		if pedantic and replaced_counter != len(replace_units):
 			print('Aborted because of pedantic flag')
@@ -384,40 +584,35 @@ class TranslationUnit:
 				print('Invalid source json file format!')
 				exit(1)
 
-class BinaryLocalizationParser:
-	@staticmethod
-	def parse(bytes_stream: BytesIO) -> 'TranslationUnit':
-		id_bytes = bytes_stream.read(4)
-		if len(id_bytes) < 4:
-			raise EOFError()
-		
-		id = int.from_bytes(id_bytes, byteorder='little')
-		original_length = int.from_bytes(bytes_stream.read(4), byteorder='little')
-		text = bytes_stream.read(original_length).decode(encoding='utf-8')
+class TranslationUnitEncoder(json.JSONEncoder):
+	'''Encodes units lazily while dumping instead of prebuilding list of dicts'''
+	def default(self, o: object) -> object:
+		if isinstance(o, TranslationUnit):
+			return o.to_dict() # type: ignore
+		return super().default(o)
 
-		parsed = TranslationUnit(id, original_length, text)
-
-		if original_length < parsed.max_size:
-			bytes_stream.seek((4 - original_length % 4), 1)
-
-		return parsed
-	
+class BinaryLocalizationParser:
 	@staticmethod
-	def parse_batch(bytes_stream: BytesIO) -> list['TranslationUnit']:
+	def parse_mv(sector: memoryview) -> list['TranslationUnit']:
+		'''Parses units from sector: little endian id and length header followed by 4 byte aligned text'''
 		units: list[TranslationUnit] = []
-		while True:
-			try:
-				units.append(BinaryLocalizationParser.parse(bytes_stream))
-			except EOFError:
-				break
+		append = units.append
+		unpack_header = UNIT_HEADER.unpack_from
+		sector_size = len(sector)
+		offset = 0
+		while offset + 8 <= sector_size:
+			id, original_length = unpack_header(sector, offset)
+			text_offset = offset + 8
+			append(TranslationUnit(id, original_length, 
+							   str(sector[text_offset:text_offset + original_length], 'utf-8')))
+			offset = text_offset + ((original_length + 3) & ~3)
 
 		return units
 
 	@staticmethod
 	def parse_sector(file: BufferedReader, start: int, stop: int) -> list['TranslationUnit']:
 		file.seek(start, SEEK_SET)
-		original_bytes = file.read(stop - start + 1)
-		return BinaryLocalizationParser.parse_batch(BytesIO(original_bytes))
+		return BinaryLocalizationParser.parse_mv(memoryview(file.read(stop - start + 1)))
 
 def cli():
 	try:
@@ -461,11 +656,13 @@ def cli():
 		# Translating
 		if args.target_lang_code != '' and args.target_lang_code != args.source_lang_code:
 			print(f'Translating {len(units)} units...')
-			translation_result = TranslationUnit.translate_by_batch(units, 
-																	args.batch_size, 
-																	args.source_lang_code, 
-																	args.target_lang_code,
-																	args.verbose)
+			translation_result = asyncio.run(
+				TranslationUnit.translate_by_batch(units, 
+												   args.batch_size, 
+												   args.source_lang_code, 
+												   args.target_lang_code,
+												   args.verbose,
+												   args.pool_size))
 			print(f'Omitted {translation_result.omitted} too long translations with special expressions...')
 			print(f'Overwriting {len(translation_result.units)} translated units...')
 			units = translation_result.units
@@ -473,18 +670,22 @@ def cli():
 		# Writing units
 		match args.output_file_type:
 			case 'binary':
-				with open(args.input_file, 'rb') as input, open(args.output_file, 'wb') as output:
+				translated_bytes = TranslationUnit.to_bytearray(units)
+				if is_patchable_copy(args.input_file, args.output_file, 
+									 args.first_byte, args.first_byte + len(translated_bytes)):
+					print('Patching existing output translation...')
+				else:
 					print('Copying original translation...')
-					output.seek(0, SEEK_SET)
-					output.write(input.read())
-					translated_bytes = bytes().join(map(lambda x: x.bytes, units))
+					shutil.copyfile(args.input_file, args.output_file)
+
+				with open(args.output_file, 'r+b') as output:
 					output.seek(args.first_byte, SEEK_SET)
 					output.write(translated_bytes)
 
 			case 'json':
 				with open(args.output_file, 'w', encoding='utf-8') as output:
 					print('Externalizing to json...')
-					json.dump([u.to_dict() for u in units], output, indent=4, ensure_ascii=False) # type: ignore
+					json.dump(units, output, cls=TranslationUnitEncoder, indent=4, ensure_ascii=False)
 			
 			case _:
 				pass